@@ -9,26 +9,184 @@ Endpoints used:
   - POST /distribution/start
   - POST /distribution/pause
 """
+import asyncio
+import functools
 import json
+import math
 import os
-from typing import Any, Dict, Optional
+import time
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlsplit
 
 import gradio as gr
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None
 
 DEFAULT_BASE_URL = os.getenv("CONTROL_API_BASE", "http://localhost:3001")
 
+# Connect timeout in seconds; the per-call timeout only bounds reads.
+CONNECT_TIMEOUT = 3.05
+
+# Bodies are decoded straight from bytes as UTF-8 JSON, so ask for exactly that.
+# Accept-Encoding is left to requests, which advertises every decoder it has.
+REQUEST_HEADERS = {"Accept": "application/json"}
+
+# Largest response body read into memory before the request is abandoned.
+MAX_RESPONSE_BYTES = 2 * 1024 * 1024
+
+# Longest text rendered into the Response / Logs pane.
+LOG_MAX_CHARS = 16_384
+
+# Seconds a successful GET body is reused for repeated clicks.
+GET_CACHE_TTL = {
+    "/health": 1.0,
+    "/settings": 0.5,
+    "/distribution/status": 0.5,
+}
+# GET paths whose cached bodies a POST makes stale.
+POST_INVALIDATES = {
+    "/settings/update": ("/settings",),
+    "/holders/refresh": ("/settings",),
+    "/distribution/start": ("/distribution/status",),
+    "/distribution/pause": ("/distribution/status",),
+}
+
+# API payload keys, in the same order as the matching handler's `values` tuple.
+_SAVE_KEYS = (
+    "pollIntervalMs",
+    "triggerSol",
+    "solCap",
+    "batchSize",
+    "targetRecipients",
+    "recipientFetchSize",
+    "slippageBps",
+    "limit",
+    "minTokenAmount",
+    "minHolderBalanceSol",
+    "balanceBatchSize",
+)
+_REFRESH_KEYS = ("limit", "minTokenAmount", "minHolderBalanceSol", "balanceBatchSize")
+_DIST_KEYS = ("mint", "pollIntervalMs", "triggerSol", "solCap", "batchSize", "slippageBps")
+
+_GET_CACHE: Dict[Tuple[str, str, str], Tuple[float, bytes]] = {}
+_CACHE_GEN: Dict[Tuple[str, str, str], int] = {}
+
 
 def as_number(value: Any) -> Optional[float]:
-    if isinstance(value, bool):
+    if value is None or isinstance(value, bool):
         return None
-    if isinstance(value, (int, float)) and not isinstance(value, bool):
-        return float(value) if value is not None else None
     try:
         n = float(value)
-        return n if not (n != n) and n != float("inf") and n != float("-inf") else None
-    except Exception:  # noqa: BLE001
+    except (TypeError, ValueError, OverflowError):
         return None
+    return n if math.isfinite(n) else None
+
+
+@functools.lru_cache(maxsize=8)
+def _session_for(origin: str) -> requests.Session:
+    # One pooled keep-alive session per scheme+host so a changed base URL
+    # never shares sockets with the previous one.
+    session = requests.Session()
+    session.headers.update(REQUEST_HEADERS)
+    # Retry transient gateway errors on idempotent calls only (urllib3 leaves
+    # POST out by default); the final 5xx still surfaces via raise_for_status.
+    # Connect and read failures are not retried, so a hung or down server
+    # errors out after one timeout.
+    retry = Retry(
+        total=2,
+        connect=0,
+        read=0,
+        backoff_factor=0.2,
+        status_forcelist=(502, 503, 504),
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(max_retries=retry, pool_connections=4, pool_maxsize=16)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _origin(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def _cache_lookup(base: str, method: str, path: str) -> Tuple[Optional[float], Optional[bytes]]:
+    """Return (ttl, cached body); ttl is None for uncached calls."""
+    ttl = GET_CACHE_TTL.get(path) if method == "GET" else None
+    cached = _GET_CACHE.get((base, method, path)) if ttl is not None else None
+    if cached and time.monotonic() - cached[0] < ttl:
+        return ttl, cached[1]
+    return ttl, None
+
+
+def _invalidate(base: str, path: str) -> None:
+    for stale in POST_INVALIDATES.get(path, ()):
+        key = (base, "GET", stale)
+        _GET_CACHE.pop(key, None)
+        _CACHE_GEN[key] = _CACHE_GEN.get(key, 0) + 1
+
+
+def _cache_store(key: Tuple[str, str, str], generation: int, body: bytes) -> None:
+    # Skip the store if a POST invalidated this key while the GET was in
+    # flight; its body may predate the write.
+    if _CACHE_GEN.get(key, 0) == generation:
+        _GET_CACHE[key] = (time.monotonic(), body)
+
+
+def _check_size(buf: bytearray) -> None:
+    if len(buf) > MAX_RESPONSE_BYTES:
+        raise ValueError(f"response too large (over {MAX_RESPONSE_BYTES} bytes)")
+
+
+def _fetch(
+    base_url: str,
+    method: str,
+    path: str,
+    payload: Optional[Dict[str, Any]],
+    timeout: float,
+) -> bytes:
+    base = base_url.rstrip("/")
+    ttl, cached = _cache_lookup(base, method, path)
+    if cached is not None:
+        return cached
+
+    key = (base, method, path)
+    generation = _CACHE_GEN.get(key, 0)
+    if ttl is None:
+        _invalidate(base, path)
+
+    url = base + path
+    session = _session_for(_origin(url))
+    try:
+        response = session.request(
+            method, url, json=payload, timeout=(CONNECT_TIMEOUT, timeout), stream=True
+        )
+        try:
+            response.raise_for_status()
+            buf = bytearray()
+            for chunk in response.iter_content(65536):
+                buf += chunk
+                _check_size(buf)
+            body = bytes(buf)
+        finally:
+            response.close()
+    finally:
+        if ttl is None:
+            _invalidate(base, path)
+    if ttl is not None:
+        _cache_store(key, generation, body)
+    return body
+
+
+def _loads(body: bytes) -> Any:
+    return orjson.loads(body) if orjson else json.loads(body)
 
 
 def api_request(
@@ -38,35 +196,103 @@ def api_request(
     payload: Optional[Dict[str, Any]] = None,
     timeout: float = 10.0,
 ) -> Dict[str, Any]:
-    url = base_url.rstrip("/") + path
     try:
-        response = requests.request(method, url, json=payload, timeout=timeout)
-        response.raise_for_status()
-        return {"ok": True, "data": response.json()}
+        return {"ok": True, "data": _loads(_fetch(base_url, method, path, payload, timeout))}
     except Exception as exc:  # noqa: BLE001
         return {"ok": False, "error": str(exc)}
 
 
+async def _get(base_url: str, path: str, timeout: float = 10.0) -> Dict[str, Any]:
+    """Run a sync GET in a worker thread so several can share the pooled session."""
+    return await asyncio.to_thread(api_request, base_url, "GET", path, timeout=timeout)
+
+
+def _dict_pointer(data: Any, pointer: str) -> Any:
+    node = data
+    for key in pointer.strip("/").split("/"):
+        if not isinstance(node, dict):
+            return None
+        node = node.get(key)
+    return node
+
+
+def _truncate(text: str) -> str:
+    if len(text) <= LOG_MAX_CHARS:
+        return text
+    omitted = len(text) - LOG_MAX_CHARS
+    return text[:LOG_MAX_CHARS] + "\n... (truncated, %d chars omitted)" % omitted
+
+
+def _dumps_orjson(data: Any) -> str:
+    text = orjson.dumps(data, option=orjson.OPT_SORT_KEYS).decode()
+    if len(text) <= LOG_MAX_CHARS:
+        text = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS).decode()
+    return text
+
+
+def _dumps_stdlib(data: Any) -> str:
+    text = json.dumps(data, separators=(",", ":"), sort_keys=True)
+    if len(text) <= LOG_MAX_CHARS:
+        text = json.dumps(data, indent=2, sort_keys=True)
+    return text
+
+
 def pretty(data: Any) -> str:
-    try:
-        return json.dumps(data, indent=2)
-    except Exception:  # noqa: BLE001
-        return str(data)
+    # Serialize compactly first; only payloads small enough to show in full
+    # are re-rendered with indentation. orjson rejects some values the stdlib
+    # handles (ints over 64 bits, non-str keys), so fall back to json first.
+    text = None
+    if orjson:
+        try:
+            text = _dumps_orjson(data)
+        except Exception:  # noqa: BLE001
+            pass
+    if text is None:
+        try:
+            text = _dumps_stdlib(data)
+        except Exception:  # noqa: BLE001
+            text = str(data)
+    return _truncate(text)
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_tokens_csv(tokens_csv: str) -> Tuple[str, ...]:
+    if not tokens_csv:
+        return ()
+    return tuple(t.strip() for t in tokens_csv.split(",") if t.strip())
 
 
 def check_health(base_url: str):
     return pretty(api_request(base_url, "GET", "/health"))
 
 
-def load_settings(base_url: str):
-    return pretty(api_request(base_url, "GET", "/settings"))
-
-
 def load_settings_full(base_url: str):
     resp = api_request(base_url, "GET", "/settings")
     return parse_settings_response(resp)
 
 
+async def startup(base_url: str):
+    health, settings, status = await asyncio.gather(
+        _get(base_url, "/health"),
+        _get(base_url, "/settings"),
+        _get(base_url, "/distribution/status"),
+    )
+    # Field extraction and log rendering are CPU work; keep them off Gradio's event loop.
+    return await asyncio.to_thread(_startup_result, health, settings, status)
+
+
+def _startup_result(health: Dict[str, Any], settings: Dict[str, Any], status: Dict[str, Any]):
+    settings_log, *fields = parse_settings_response(settings)
+    log = "\n\n".join(
+        (
+            "GET /health\n" + pretty(health),
+            "GET /settings\n" + settings_log,
+            "GET /distribution/status\n" + pretty(status),
+        )
+    )
+    return (log, *fields)
+
+
 def save_settings(
     base_url: str,
     poll_interval_ms: Optional[float],
@@ -83,33 +309,24 @@ def save_settings(
     refetch_existing: bool,
     balance_batch_size: Optional[float],
 ):
-    tokens = [t.strip() for t in tokens_csv.split(",") if t.strip()] if tokens_csv else None
-    poll_interval_ms = as_number(poll_interval_ms)
-    trigger_sol = as_number(trigger_sol)
-    sol_cap = as_number(sol_cap)
-    batch_size = as_number(batch_size)
-    target_recipients = as_number(target_recipients)
-    recipient_fetch_size = as_number(recipient_fetch_size)
-    slippage_bps = as_number(slippage_bps)
-    limit = as_number(limit)
-    min_token_amount = as_number(min_token_amount)
-    min_holder_balance_sol = as_number(min_holder_balance_sol)
-    balance_batch_size = as_number(balance_batch_size)
-    payload = {
-        "pollIntervalMs": poll_interval_ms,
-        "triggerSol": trigger_sol,
-        "solCap": sol_cap,
-        "batchSize": batch_size,
-        "targetRecipients": target_recipients,
-        "recipientFetchSize": recipient_fetch_size,
-        "slippageBps": slippage_bps,
-        "tokens": tokens,
-        "limit": limit,
-        "minTokenAmount": min_token_amount,
-        "minHolderBalanceSol": min_holder_balance_sol,
-        "refetchExisting": refetch_existing,
-        "balanceBatchSize": balance_batch_size,
-    }
+    tokens = list(_parse_tokens_csv(tokens_csv)) or None
+    values = (
+        poll_interval_ms,
+        trigger_sol,
+        sol_cap,
+        batch_size,
+        target_recipients,
+        recipient_fetch_size,
+        slippage_bps,
+        limit,
+        min_token_amount,
+        min_holder_balance_sol,
+        balance_batch_size,
+    )
+    assert len(values) == len(_SAVE_KEYS)
+    payload: Dict[str, Any] = dict(zip(_SAVE_KEYS, map(as_number, values)))
+    payload["tokens"] = tokens
+    payload["refetchExisting"] = refetch_existing
     resp = api_request(base_url, "POST", "/settings/update", payload, timeout=15.0)
     return parse_settings_response(resp)
 
@@ -123,19 +340,13 @@ def refresh_holders(
     balance_batch_size: Optional[float],
     refetch_existing: bool,
 ):
-    tokens = [t.strip() for t in tokens_csv.split(",") if t.strip()] if tokens_csv else None
-    limit = as_number(limit)
-    min_token_amount = as_number(min_token_amount)
-    min_holder_balance_sol = as_number(min_holder_balance_sol)
-    balance_batch_size = as_number(balance_batch_size)
-    payload = {
-        "tokens": tokens,
-        "limit": limit or None,
-        "minTokenAmount": min_token_amount,
-        "minHolderBalanceSol": min_holder_balance_sol,
-        "balanceBatchSize": balance_batch_size,
-        "refetchExisting": refetch_existing,
-    }
+    tokens = list(_parse_tokens_csv(tokens_csv)) or None
+    values = (limit, min_token_amount, min_holder_balance_sol, balance_batch_size)
+    assert len(values) == len(_REFRESH_KEYS)
+    payload: Dict[str, Any] = dict(zip(_REFRESH_KEYS, map(as_number, values)))
+    payload["limit"] = payload["limit"] or None
+    payload["tokens"] = tokens
+    payload["refetchExisting"] = refetch_existing
     return pretty(api_request(base_url, "POST", "/holders/refresh", payload, timeout=30.0))
 
 
@@ -152,14 +363,9 @@ def start_distribution(
     batch_size: int,
     slippage_bps: int,
 ):
-    payload = {
-        "mint": mint or None,
-        "pollIntervalMs": poll_interval_ms or None,
-        "triggerSol": trigger_sol or None,
-        "solCap": sol_cap or None,
-        "batchSize": batch_size or None,
-        "slippageBps": slippage_bps or None,
-    }
+    values = (mint, poll_interval_ms, trigger_sol, sol_cap, batch_size, slippage_bps)
+    assert len(values) == len(_DIST_KEYS)
+    payload = {key: value or None for key, value in zip(_DIST_KEYS, values)}
     return pretty(api_request(base_url, "POST", "/distribution/start", payload))
 
 
@@ -167,6 +373,29 @@ def pause_distribution(base_url: str):
     return pretty(api_request(base_url, "POST", "/distribution/pause"))
 
 
+def _settings_defaults(get) -> Dict[str, Any]:
+    return {
+        "mint": get("/mintPublicKey") or get("/settings/mintPublicKey") or "",
+        "poll_interval": as_number(get("/settings/buyback/pollIntervalMs")),
+        "trigger_sol": as_number(get("/settings/buyback/triggerSol")),
+        "sol_cap": as_number(get("/settings/buyback/solCap")),
+        "batch_size": as_number(get("/settings/distribution/batchSize")),
+        "target_recipients": as_number(get("/settings/distribution/targetRecipients")),
+        "recipient_fetch_size": as_number(get("/settings/distribution/fetchSize")),
+        "slippage_bps": as_number(get("/settings/defaults/defaultSlippageBps")),
+        "tokens_csv": ", ".join(
+            get("/holderTokens") or get("/settings/holders/tokens") or []
+        ),
+        "limit": as_number(get("/settings/holders/maxFetchHolders")),
+        "min_token_amount": as_number(get("/settings/holders/minHolderTokenAmount")),
+        "min_holder_balance_sol": as_number(get("/settings/holders/minHolderBalanceSol")),
+        "refetch_existing": get("/settings/holders/refetchAll") is True,
+        "balance_batch_size": as_number(get("/settings/holders/balanceBatchSize")),
+        "unique_holders": get("/holderSummary/uniqueHolders"),
+        "sent_count": get("/sentCount"),
+    }
+
+
 def parse_settings_response(resp: Dict[str, Any]):
     defaults = {
         "mint": "",
@@ -186,36 +415,11 @@ def parse_settings_response(resp: Dict[str, Any]):
         "unique_holders": None,
         "sent_count": None,
     }
+    log = pretty(resp)
     if resp.get("ok"):
-        data = resp.get("data", {})
-        settings = data.get("settings", {})
-        buyback = settings.get("buyback", {})
-        distribution = settings.get("distribution", {})
-        holders = settings.get("holders", {})
-        holder_tokens = data.get("holderTokens") or []
-        holder_summary = data.get("holderSummary") or {}
-        defaults = {
-          "mint": data.get("mintPublicKey")
-          or settings.get("mintPublicKey")
-          or "",
-          "poll_interval": as_number(buyback.get("pollIntervalMs")),
-          "trigger_sol": as_number(buyback.get("triggerSol")),
-          "sol_cap": as_number(buyback.get("solCap")),
-          "batch_size": as_number(distribution.get("batchSize")),
-          "target_recipients": as_number(distribution.get("targetRecipients")),
-          "recipient_fetch_size": as_number(distribution.get("fetchSize")),
-          "slippage_bps": as_number(settings.get("defaults", {}).get("defaultSlippageBps")),
-          "tokens_csv": ", ".join(holder_tokens or holders.get("tokens", []) or []),
-          "limit": as_number(holders.get("maxFetchHolders")),
-          "min_token_amount": as_number(holders.get("minHolderTokenAmount")),
-          "min_holder_balance_sol": as_number(holders.get("minHolderBalanceSol")),
-          "refetch_existing": holders.get("refetchAll") is True,
-          "balance_batch_size": as_number(holders.get("balanceBatchSize")),
-          "unique_holders": holder_summary.get("uniqueHolders"),
-          "sent_count": data.get("sentCount"),
-        }
+        defaults = _settings_defaults(functools.partial(_dict_pointer, resp.get("data") or {}))
     return (
-        pretty(resp),
+        log,
         defaults["mint"],
         defaults["poll_interval"],
         defaults["trigger_sol"],
@@ -425,7 +629,7 @@ with gr.Blocks(title="Control API Panel") as demo:
     )
 
     demo.load(
-        load_settings_full,
+        startup,
         inputs=base_url,
         outputs=[
             output,